@@ -17,16 +17,23 @@
 
 __all__ = ['__version__']
 
-import pbr.version
 
-version_info = pbr.version.VersionInfo('python-distilclient')
+def __getattr__(name):
+    # Resolved lazily (PEP 562) so importing the package does not pay
+    # pbr's installed-metadata walk unless the version is actually read.
+    if name in ('__version__', 'version_info'):
+        import pbr.version
 
-try:
-    __version__ = version_info.version_string()
-except AttributeError:
-    __version__ = None
+        version_info = pbr.version.VersionInfo('python-distilclient')
+        if name == 'version_info':
+            return version_info
+        try:
+            return version_info.version_string()
+        except AttributeError:
+            return None
+    raise AttributeError(name)
 
 
-API_MAX_VERSION = '1'
-API_MIN_VERSION = '2'
+API_MAX_VERSION = '2'
+API_MIN_VERSION = '1'
 API_DEPRECATED_VERSION = []
@@ -444,10 +444,30 @@ class Resource(object):
         self._add_details(info)
         self._loaded = loaded
 
+    def __setattr__(self, name, value):
+        # A new public attribute changes the repr key set; drop the
+        # cached tuple so __repr__ rebuilds it.
+        if name[0] != '_':
+            self.__dict__.pop('_repr_keys', None)
+        object.__setattr__(self, name, value)
+
+    def __delattr__(self, name):
+        # Removing a public attribute changes the repr key set as well.
+        if name[0] != '_':
+            self.__dict__.pop('_repr_keys', None)
+        object.__delattr__(self, name)
+
     def __repr__(self):
-        reprkeys = sorted(k
-                          for k in self.__dict__.keys()
-                          if k[0] != '_' and k != 'manager')
+        # The sorted key tuple is cached (and invalidated whenever a
+        # public attribute is set) so that repr-heavy callers such as
+        # logging of large resource lists do not re-sort identical key
+        # sets.
+        reprkeys = self.__dict__.get('_repr_keys')
+        if reprkeys is None:
+            reprkeys = tuple(sorted(k
+                                    for k in self.__dict__.keys()
+                                    if k[0] != '_' and k != 'manager'))
+            self.__dict__['_repr_keys'] = reprkeys
         info = ", ".join("%s=%s" % (k, getattr(self, k)) for k in reprkeys)
         return "<%s %s>" % (self.__class__.__name__, info)
 
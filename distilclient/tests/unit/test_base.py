@@ -21,9 +21,22 @@ cs = fakes.FakeClient()
 class BaseTest(utils.TestCase):
 
     def test_resource_repr(self):
-        r = common_base.Resource(None, dict(foo="bar", baz="spam"))
+        r = common_base.Resource(None, {'foo': 'bar', 'baz': 'spam'})
         self.assertEqual(repr(r), "<Resource baz=spam, foo=bar>")
 
+    def test_resource_repr_after_setattr(self):
+        r = common_base.Resource(None, {'foo': 'bar'}, loaded=True)
+        self.assertEqual(repr(r), "<Resource foo=bar>")
+        r.baz = 'spam'
+        self.assertEqual(repr(r), "<Resource baz=spam, foo=bar>")
+
+    def test_resource_repr_after_delattr(self):
+        r = common_base.Resource(None, {'foo': 'bar', 'baz': 'spam'},
+                                 loaded=True)
+        self.assertEqual(repr(r), "<Resource baz=spam, foo=bar>")
+        del r.baz
+        self.assertEqual(repr(r), "<Resource foo=bar>")
+
     def test_eq(self):
         # Two resources of the same type with the same id: equal
         # The truth of r1==r2 does not imply that r1!=r2 is false in PY2.
@@ -13,6 +13,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import time
+
 import ddt
 
 import mock
@@ -29,6 +31,9 @@ from oslo_utils import uuidutils
 class ClientTest(utils.TestCase):
     def setUp(self):
         super(self.__class__, self).setUp()
+        client._TOKEN_CACHE.clear()
+        client._DISCOVERY_CACHE.clear()
+        client._ENDPOINT_CACHE.clear()
         self.catalog = {
             'rating': [
                 {'region': 'TestRegion', 'publicURL': 'http://1.2.3.4'},
@@ -49,6 +54,45 @@ class ClientTest(utils.TestCase):
         self.assertEqual(base_url, c.client.endpoint_url)
         self.assertEqual(retries, c.client.retries)
 
+    def test_unsupported_api_version(self):
+        self.assertRaises(exceptions.VersionNotFoundForAPIMethod,
+                          client.Client,
+                          api_version='99',
+                          distil_url=uuidutils.generate_uuid(),
+                          input_auth_token='token')
+
+    def test_insufficient_credentials(self):
+        self.assertRaises(exceptions.ClientException, client.Client,
+                          api_version=distilclient.API_MAX_VERSION)
+
+    def test_discovery_cache_with_none_token_lifetime(self):
+        c = client.Client(input_auth_token='token',
+                          distil_url=uuidutils.generate_uuid(),
+                          api_version=distilclient.API_MAX_VERSION,
+                          cached_token_lifetime=None)
+        client._DISCOVERY_CACHE[c.auth_url] = ('url_v2.0', 'url_v3.0',
+                                               time.time())
+
+        self.assertEqual(('url_v2.0', 'url_v3.0', True),
+                         c._discover_auth_urls(mock.Mock()))
+
+    def test_unauthorized_response_evicts_cached_auth(self):
+        c = client.Client(input_auth_token='token',
+                          distil_url=uuidutils.generate_uuid(),
+                          api_version=distilclient.API_MAX_VERSION)
+        client._TOKEN_CACHE[c._token_cache_key()] = mock.Mock()
+        c._endpoint_cache_key = ('rating', None, 'publicURL')
+        client._ENDPOINT_CACHE[c._endpoint_cache_key] = 'http://1.2.3.4'
+        resp = utils.TestResponse({'status_code': 401, 'text': ''})
+        self.mock_object(c.client._session, 'request',
+                         mock.Mock(return_value=resp))
+
+        self.assertRaises(exceptions.Unauthorized,
+                          c.client.request, 'http://fake', 'GET')
+
+        self.assertNotIn(c._token_cache_key(), client._TOKEN_CACHE)
+        self.assertNotIn(c._endpoint_cache_key, client._ENDPOINT_CACHE)
+
     def test_auth_via_token_invalid(self):
         self.assertRaises(exceptions.ClientException, client.Client,
                           api_version=distilclient.API_MAX_VERSION,
@@ -81,6 +125,9 @@ class ClientTest(utils.TestCase):
         kc.service_catalog = mock.Mock()
         kc.service_catalog.get_endpoints = mock.Mock(return_value=self.catalog)
         c = client.Client(api_version=distilclient.API_DEPRECATED_VERSION,
+                          username='fake_username',
+                          password='fake_password',
+                          auth_url='fake_auth_url',
                           service_type="rating",
                           region_name='TestRegion')
         self.assertTrue(client.Client._get_keystone_client.called)
@@ -104,6 +151,9 @@ class ClientTest(utils.TestCase):
         kc.service_catalog.get_endpoints = mock.Mock(return_value=self.catalog)
         self.assertRaises(RuntimeError, client.Client,
                           api_version=distilclient.API_MAX_VERSION,
+                          username='fake_username',
+                          password='fake_password',
+                          auth_url='fake_auth_url',
                           region_name='FakeRegion')
         self.assertTrue(client.Client._get_keystone_client.called)
         kc.service_catalog.get_endpoints.assert_called_with('rating')
@@ -122,6 +172,9 @@ class ClientTest(utils.TestCase):
         kc.service_catalog = mock.Mock()
         kc.service_catalog.get_endpoints = mock.Mock(return_value=catalog)
         c = client.Client(api_version=distilclient.API_MIN_VERSION,
+                          username='fake_username',
+                          password='fake_password',
+                          auth_url='fake_auth_url',
                           service_type='ratingv2',
                           region_name='SecondRegion')
         self.assertTrue(client.Client._get_keystone_client.called)
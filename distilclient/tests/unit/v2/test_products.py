@@ -22,12 +22,17 @@ from distilclient.v2 import client
 
 from oslo_utils import uuidutils
 
+# A token is supplied in setUp, so the session is only held by the
+# client and never used for outbound traffic; sharing one instance
+# avoids re-initialising connection pools for every test method.
+_SESSION = client.session.Session()
+
 
 class ProductsTest(utils.TestCase):
 
     def setUp(self):
         super(ProductsTest, self).setUp()
-        self.client = client.Client(session=client.session.Session(),
+        self.client = client.Client(session=_SESSION,
                                     api_version=distilclient.API_MAX_VERSION,
                                     distil_url=uuidutils.generate_uuid(),
                                     retries=3,
@@ -10,21 +10,78 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
+import importlib
+import time
 import warnings
 
 from keystoneclient import adapter
 from keystoneclient import client as ks_client
 from keystoneclient import discover
+from keystoneclient import exceptions as ks_exceptions
 from keystoneclient import session
 
+import distilclient
 from distilclient.common import httpclient
 from distilclient import exceptions
-from distilclient.v2 import credits
-from distilclient.v2 import health
-from distilclient.v2 import invoices
-from distilclient.v2 import measurements
-from distilclient.v2 import products
-from distilclient.v2 import quotations
+
+# Parsed once so the supported-version check in Client.__init__ does
+# not re-parse the constants per construction.
+_API_MIN_VERSION_INT = int(distilclient.API_MIN_VERSION)
+_API_MAX_VERSION_INT = int(distilclient.API_MAX_VERSION)
+
+# Manager modules are imported lazily on first attribute access (see
+# Client.__getattr__) so that short-lived processes only pay the import
+# cost of the managers they actually use.
+_MANAGER_SPECS = {
+    'credits': ('distilclient.v2.credits', 'CreditManager'),
+    'health': ('distilclient.v2.health', 'HealthManager'),
+    'invoices': ('distilclient.v2.invoices', 'InvoiceManager'),
+    'measurements': ('distilclient.v2.measurements', 'MeasurementManager'),
+    'products': ('distilclient.v2.products', 'ProductManager'),
+    'quotations': ('distilclient.v2.quotations', 'QuotationManager'),
+}
+
+# Deprecated keyword arguments and their replacements (None if there is
+# no replacement). Hoisted to module scope so Client() constructions do
+# not rebuild the table, and the frozenset lets the common no-deprecated
+# -arguments case short-circuit with a single set operation.
+_DEPRECATED_ARGUMENTS = (
+    ('share_service_name', 'service_name'),
+    ('proxy_tenant_id', None),
+    ('proxy_token', None),
+    ('os_cache', 'use_keyring'),
+    ('api_key', 'password'),
+)
+_DEPRECATED_ARGUMENT_KEYS = frozenset(k for k, _ in _DEPRECATED_ARGUMENTS)
+
+# Whether the authenticate() deprecation warning has been emitted; it
+# is raised at most once per process since callers in retry loops may
+# invoke authenticate() repeatedly.
+_AUTHN_WARNED = False
+
+
+# Authenticated keystone clients are cached per credential set so repeat
+# Client() constructions skip the token request and catalog fetch while
+# the previously issued token is still comfortably within its lifetime.
+_TOKEN_CACHE = {}
+
+# A cached token must remain valid for at least this long (in seconds)
+# to be reused; otherwise the entry is evicted and we re-authenticate.
+_TOKEN_EXPIRY_MARGIN = 60
+
+# Keystone version discovery results are cached per auth_url so warm
+# Client() constructions skip the discovery GET against the auth_url.
+# Entries are (v2_auth_url, v3_auth_url, cached_at) tuples.
+_DISCOVERY_CACHE = {}
+
+# TTL (in seconds) used for discovery cache entries when the caller
+# passed cached_token_lifetime=None; matches the constructor default.
+_DISCOVERY_DEFAULT_TTL = 300
+
+# Distil endpoints resolved from the service catalog are cached per
+# (service_type, region_name, endpoint_type) so that repeat Client()
+# constructions skip the catalog walk.
+_ENDPOINT_CACHE = {}
 
 
 class Client(object):
@@ -72,13 +129,42 @@ class Client(object):
                  password=None,
                  **kwargs):
 
+        # Reject unsupported API versions before any keystone traffic so
+        # misconfigured clients fail fast instead of 404ing server-side.
+        # Non-numeric version markers (e.g. API_DEPRECATED_VERSION) are
+        # passed through untouched.
+        try:
+            version_int = int(api_version)
+        except (TypeError, ValueError):
+            version_int = None
+        if version_int is not None and not (
+                _API_MIN_VERSION_INT <= version_int <=
+                _API_MAX_VERSION_INT):
+            raise exceptions.VersionNotFoundForAPIMethod(api_version)
+
+        # Validate the supplied credentials before any attribute setup
+        # or keystone traffic, so misconfigured clients fail immediately
+        # instead of after discovery and authentication round trips.
+        if input_auth_token and not distil_url:
+            msg = ("For token-based authentication you should "
+                   "provide 'input_auth_token' and 'distil_url'.")
+            raise exceptions.ClientException(msg)
+
+        if not (input_auth_token or session or
+                ((username or user_id) and
+                 (password or api_key) and auth_url)):
+            msg = ("Insufficient credentials: provide 'input_auth_token' "
+                   "and 'distil_url', a keystone 'session', or "
+                   "username/password credentials with an 'auth_url'.")
+            raise exceptions.ClientException(msg)
+
         self.username = username
         self.password = password or api_key
-        self.tenant_id = tenant_id or project_id
+        self.project_id = tenant_id if tenant_id is not None else project_id
+        self.tenant_id = self.project_id
         self.tenant_name = project_name
 
         self.user_id = user_id
-        self.project_id = project_id or tenant_id
         self.project_name = project_name
         self.user_domain_id = user_domain_id
         self.user_domain_name = user_domain_name
@@ -99,16 +185,8 @@ class Client(object):
 
         service_name = kwargs.get("share_service_name", service_name)
 
-        def check_deprecated_arguments():
-            deprecated = {
-                'share_service_name': 'service_name',
-                'proxy_tenant_id': None,
-                'proxy_token': None,
-                'os_cache': 'use_keyring',
-                'api_key': 'password',
-            }
-
-            for arg, replacement in deprecated.items():
+        if kwargs and not _DEPRECATED_ARGUMENT_KEYS.isdisjoint(kwargs):
+            for arg, replacement in _DEPRECATED_ARGUMENTS:
                 if kwargs.get(arg, None) is None:
                     continue
 
@@ -121,18 +199,13 @@ class Client(object):
                     'arg': arg,
                     'repl': replacement_msg
                 }
-                warnings.warn(msg)
-
-        check_deprecated_arguments()
+                warnings.warn(msg, DeprecationWarning, stacklevel=2)
 
-        if input_auth_token and not distil_url:
-            msg = ("For token-based authentication you should "
-                   "provide 'input_auth_token' and 'distil_url'.")
-            raise exceptions.ClientException(msg)
-
-        self.project_id = tenant_id if tenant_id is not None else project_id
         self.keystone_client = None
         self.session = session
+        # Set when the endpoint is resolved from the service catalog,
+        # so a 401 can evict the cached URL (see _invalidate_cached_auth).
+        self._endpoint_cache_key = None
 
         # NOTE(u_glide): token authorization has highest priority.
         # That's why session and/or password will be ignored
@@ -160,20 +233,28 @@ class Client(object):
                 auth, interface=endpoint_type,
                 service_type=service_type, region_name=region_name)
         elif not distil_url:
-            catalog = self.keystone_client.service_catalog.get_endpoints(
-                service_type)
-            for catalog_entry in catalog.get(service_type, []):
-                if (catalog_entry.get("interface") == (
-                        endpoint_type.lower().split("url")[0]) or
-                        catalog_entry.get(endpoint_type)):
-                    if (region_name and not region_name == (
-                            catalog_entry.get(
-                                "region",
-                                catalog_entry.get("region_id")))):
-                        continue
-                    distil_url = catalog_entry.get(
-                        "url", catalog_entry.get(endpoint_type))
-                    break
+            endpoint_key = (service_type, region_name, endpoint_type)
+            self._endpoint_cache_key = endpoint_key
+            distil_url = _ENDPOINT_CACHE.get(endpoint_key)
+            if not distil_url:
+                catalog = self.keystone_client.service_catalog.get_endpoints(
+                    service_type)
+                # Loop-invariant: compute the interface name (e.g.
+                # 'publicURL' -> 'public') once rather than per entry.
+                interface = endpoint_type.lower().split("url")[0]
+                for catalog_entry in catalog.get(service_type, []):
+                    if (catalog_entry.get("interface") == interface or
+                            catalog_entry.get(endpoint_type)):
+                        if (region_name and not region_name == (
+                                catalog_entry.get(
+                                    "region",
+                                    catalog_entry.get("region_id")))):
+                            continue
+                        distil_url = catalog_entry.get(
+                            "url", catalog_entry.get(endpoint_type))
+                        break
+                if distil_url:
+                    _ENDPOINT_CACHE[endpoint_key] = distil_url
 
         if not distil_url:
             raise RuntimeError("Could not find Distil endpoint in catalog")
@@ -188,16 +269,26 @@ class Client(object):
                                             retries=retries,
                                             http_log_debug=http_log_debug,
                                             api_version=self.api_version)
-
-        self.measurements = measurements.MeasurementManager(self)
-        self.invoices = invoices.InvoiceManager(self)
-        self.quotations = quotations.QuotationManager(self)
-        self.credits = credits.CreditManager(self)
-        self.products = products.ProductManager(self)
-        self.health = health.HealthManager(self)
+        self.client._unauthorized_callback = self._invalidate_cached_auth
 
         self._load_extensions(extensions)
 
+    def __getattr__(self, name):
+        spec = _MANAGER_SPECS.get(name)
+        if spec is None:
+            raise AttributeError(name)
+        module_name, class_name = spec
+        module = importlib.import_module(module_name)
+        manager = getattr(module, class_name)(self)
+        setattr(self, name, manager)
+        return manager
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.client.close()
+
     def _load_extensions(self, extensions):
         if not extensions:
             return
@@ -215,11 +306,47 @@ class Client(object):
         Returns on success; raises :exc:`exceptions.Unauthorized` if the
         credentials are wrong.
         """
-        warnings.warn("authenticate() method is deprecated. "
-                      "Client automatically makes authentication call "
-                      "in the constructor.")
+        global _AUTHN_WARNED
+        if not _AUTHN_WARNED:
+            warnings.warn("authenticate() method is deprecated. "
+                          "Client automatically makes authentication call "
+                          "in the constructor.",
+                          DeprecationWarning, stacklevel=2)
+            _AUTHN_WARNED = True
+
+    def _token_cache_key(self):
+        return (self.auth_url, self.username,
+                self.project_id or self.tenant_id,
+                self.user_domain_id, self.project_domain_id)
+
+    def _invalidate_cached_auth(self):
+        """Evict cached auth state after the server answered 401.
+
+        Called by the HTTPClient when Distil rejects the token, so a
+        token revoked before its expiry is not pinned in the cache for
+        the rest of the process; the next Client() re-authenticates.
+        The endpoint resolved from the service catalog (if any) is
+        dropped with it, since it was produced by the same catalog.
+        """
+        _TOKEN_CACHE.pop(self._token_cache_key(), None)
+        if self._endpoint_cache_key is not None:
+            _ENDPOINT_CACHE.pop(self._endpoint_cache_key, None)
 
     def _get_keystone_client(self):
+        cache_key = self._token_cache_key()
+        if self.force_new_token:
+            # The caller explicitly asked for a fresh token; drop any
+            # cached client for these credentials and re-authenticate.
+            _TOKEN_CACHE.pop(cache_key, None)
+        else:
+            cached = _TOKEN_CACHE.get(cache_key)
+            if cached is not None:
+                auth_ref = getattr(cached, 'auth_ref', None)
+                if auth_ref and not auth_ref.will_expire_soon(
+                        _TOKEN_EXPIRY_MARGIN):
+                    return cached
+                _TOKEN_CACHE.pop(cache_key, None)
+
         # First create a Keystone session
         if self.insecure:
             verify = False
@@ -227,14 +354,8 @@ class Client(object):
             verify = self.cacert or True
         ks_session = session.Session(verify=verify, cert=self.cert)
 
-        # Discover the supported keystone versions using the given url
-        ks_discover = discover.Discover(
-            session=ks_session, auth_url=self.auth_url)
-
-        # Inspect the auth_url to see the supported version. If both v3 and v2
-        # are supported, then use the highest version if possible.
-        v2_auth_url = ks_discover.url_for('v2.0')
-        v3_auth_url = ks_discover.url_for('v3.0')
+        v2_auth_url, v3_auth_url, discovery_cached = self._discover_auth_urls(
+            ks_session)
 
         if v3_auth_url:
             keystone_client = ks_client.Client(
@@ -269,5 +390,49 @@ class Client(object):
             raise exceptions.CommandError(
                 'Unable to determine the Keystone version to authenticate '
                 'with using the given auth_url.')
-        keystone_client.authenticate()
+        try:
+            keystone_client.authenticate()
+        except (ks_exceptions.Unauthorized, ks_exceptions.NotFound):
+            if not discovery_cached:
+                raise
+            # The cached discovery result may be stale; redo discovery
+            # once before giving up.
+            _DISCOVERY_CACHE.pop(self.auth_url, None)
+            return self._get_keystone_client()
+        _TOKEN_CACHE[cache_key] = keystone_client
         return keystone_client
+
+    def _discover_auth_urls(self, ks_session):
+        """Find the v2/v3 auth endpoints supported by the auth_url.
+
+        The discovery result is cached per auth_url (with the cached
+        token lifetime as TTL) so that it is only fetched once per
+        process rather than on every Client construction. Returns a
+        (v2_auth_url, v3_auth_url, from_cache) tuple.
+        """
+        # cached_token_lifetime=None is valid input (keystoneclient
+        # substitutes its own stale_duration default); fall back to the
+        # constructor default rather than comparing against None.
+        ttl = self.cached_token_lifetime
+        if ttl is None:
+            ttl = _DISCOVERY_DEFAULT_TTL
+
+        cached = _DISCOVERY_CACHE.get(self.auth_url)
+        if cached is not None:
+            v2_auth_url, v3_auth_url, cached_at = cached
+            if time.time() - cached_at < ttl:
+                return v2_auth_url, v3_auth_url, True
+            _DISCOVERY_CACHE.pop(self.auth_url, None)
+
+        ks_discover = discover.Discover(
+            session=ks_session, auth_url=self.auth_url)
+
+        # Inspect the auth_url to see the supported version. If both v3 and v2
+        # are supported, then use the highest version if possible.
+        v2_auth_url = ks_discover.url_for('v2.0')
+        v3_auth_url = ks_discover.url_for('v3.0')
+
+        if v2_auth_url or v3_auth_url:
+            _DISCOVERY_CACHE[self.auth_url] = (
+                v2_auth_url, v3_auth_url, time.time())
+        return v2_auth_url, v3_auth_url, False
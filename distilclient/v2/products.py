@@ -17,7 +17,7 @@ from distilclient import base
 
 class ProductManager(base.Manager):
 
-    def list(self, regions=[]):
+    def list(self, regions=None):
         """Retrieve a list of products.
 
         :returns: A list of products.
@@ -25,6 +25,6 @@ class ProductManager(base.Manager):
 
         url = "/v2/products"
         if regions:
-            url += "?regions=" + ",".join(regions)
+            url = "%s?regions=%s" % (url, ",".join(regions))
 
         return self._list(url, "products")